@@ -23,6 +23,7 @@ if str(SRC) not in sys.path:
 from bean_lens import normalize_bean_info  # noqa: E402
 from bean_lens.core import extract_with_metadata  # noqa: E402
 from bean_lens.exceptions import AuthenticationError, ImageError, RateLimitError  # noqa: E402
+from bean_lens.normalization import track_unknown_webhooks  # noqa: E402
 from bean_lens.normalization.repository import DictionaryRepository  # noqa: E402
 
 app = FastAPI(title="bean-lens API", version="1.0.0")
@@ -321,17 +322,26 @@ async def extract_bean_info(request: Request, image: UploadFile | None = File(de
     try:
         pil_image = Image.open(BytesIO(payload))
         extracted, extraction_metadata = extract_with_metadata(pil_image)
-        normalized = normalize_bean_info(
-            extracted,
-            dictionary_version=DICTIONARY_VERSION,
-            flavor_note_mode=FLAVOR_NOTE_MODE,
-            flavor_note_fuzzy_threshold=FLAVOR_NOTE_FUZZY_THRESHOLD,
-            unknown_queue_path=UNKNOWN_QUEUE_PATH,
-            unknown_min_confidence=UNKNOWN_QUEUE_MIN_CONFIDENCE,
-            unknown_queue_webhook_url=UNKNOWN_QUEUE_WEBHOOK_URL,
-            unknown_queue_webhook_timeout_sec=UNKNOWN_QUEUE_WEBHOOK_TIMEOUT_SEC,
-            unknown_queue_webhook_token=UNKNOWN_QUEUE_WEBHOOK_TOKEN,
-        )
+        with track_unknown_webhooks() as webhooks:
+            normalized = normalize_bean_info(
+                extracted,
+                dictionary_version=DICTIONARY_VERSION,
+                flavor_note_mode=FLAVOR_NOTE_MODE,
+                flavor_note_fuzzy_threshold=FLAVOR_NOTE_FUZZY_THRESHOLD,
+                unknown_queue_path=UNKNOWN_QUEUE_PATH,
+                unknown_min_confidence=UNKNOWN_QUEUE_MIN_CONFIDENCE,
+                unknown_queue_webhook_url=UNKNOWN_QUEUE_WEBHOOK_URL,
+                unknown_queue_webhook_timeout_sec=UNKNOWN_QUEUE_WEBHOOK_TIMEOUT_SEC,
+                unknown_queue_webhook_token=UNKNOWN_QUEUE_WEBHOOK_TOKEN,
+            )
+        # Webhooks are posted from a background thread, which a serverless runtime may
+        # freeze once the response is returned, so deliver this request's ones first.
+        if webhooks and not webhooks.wait(timeout_per_item=UNKNOWN_QUEUE_WEBHOOK_TIMEOUT_SEC):
+            logger.warning(
+                "%d unknown-queue webhooks not delivered within %.1fs each",
+                len(webhooks),
+                UNKNOWN_QUEUE_WEBHOOK_TIMEOUT_SEC,
+            )
         EXTRACTION_LOGGER.log_success(
             request_id=request_id,
             payload=payload,
@@ -8,9 +8,10 @@ Checks:
 
 from __future__ import annotations
 
+import ast
 import json
+import operator
 import re
-import runpy
 import sys
 import unicodedata
 from pathlib import Path
@@ -33,10 +34,20 @@ def fail(message: str) -> None:
 
 
 def load_python_constant(path: Path, key: str) -> list[dict]:
-    namespace = runpy.run_path(str(path))
-    if key not in namespace or not isinstance(namespace[key], list):
-        fail(f"Missing or invalid constant '{key}' in {path}")
-    return namespace[key]
+    # Dictionary modules are plain literals, so read the constant without executing the file.
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    for node in tree.body:
+        if not isinstance(node, ast.Assign):
+            continue
+        if any(isinstance(target, ast.Name) and target.id == key for target in node.targets):
+            try:
+                value = ast.literal_eval(node.value)
+            except ValueError:
+                fail(f"Constant '{key}' in {path} must be a literal")
+            if isinstance(value, list):
+                return value
+            break
+    fail(f"Missing or invalid constant '{key}' in {path}")
 
 
 def load_json(path: Path) -> list[dict]:
@@ -57,9 +68,13 @@ def assert_py_json_mirror(py_data: list[dict], json_data: list[dict], label: str
 
 
 def validate_alias_references(terms: list[dict], aliases: list[dict]) -> None:
-    valid_keys = {(item["domain"], item["key"]) for item in terms}
+    valid_keys = frozenset((item["domain"], item["key"]) for item in terms)
+    get_ref = operator.itemgetter("domain", "key")
     for alias in aliases:
-        ref = (alias.get("domain"), alias.get("key"))
+        try:
+            ref = get_ref(alias)
+        except KeyError:
+            fail(f"Invalid alias entry: {alias}")
         if ref not in valid_keys:
             fail(f"Alias references unknown term key: {ref}")
 
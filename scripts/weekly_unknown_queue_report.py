@@ -19,21 +19,24 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import io
 import json
+import operator
+import os
 import re
 import unicodedata
 from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Any
 
 ROOT = Path(__file__).resolve().parent.parent
 VALID_DOMAINS = ("process", "roast_level", "country", "variety", "flavor_note")
+COMPOUND_SEPARATORS = frozenset(",\n;/|·、")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Event:
     ts: datetime
     domain: str
@@ -51,6 +54,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--days", type=int, default=7, help="Lookback window in days (default: 7)")
     parser.add_argument("--top", type=int, default=20, help="Top raw values per domain (default: 20)")
     parser.add_argument("--dictionary-version", default="v2", help="Dictionary version (default: v2)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(len(VALID_DOMAINS), os.cpu_count() or 1),
+        help="Processes used for per-domain typo hints (default: min(5, CPU count))",
+    )
     parser.add_argument(
         "--format",
         choices=("markdown", "json"),
@@ -117,17 +126,35 @@ def _load_postgres(database_url: str) -> list[dict[str, Any]]:
     return [dict(row) for row in rows]
 
 
+_ROW_DEFAULTS: dict[str, Any] = {
+    "ts": None,
+    "domain": "",
+    "raw": "",
+    "reason": "",
+    "method": "",
+    "confidence": None,
+    "normalized_key": None,
+}
+_get_row_fields = operator.itemgetter(*_ROW_DEFAULTS)
+
+
 def _rows_to_events(rows: list[dict[str, Any]], since_utc: datetime) -> list[Event]:
     events: list[Event] = []
     for row in rows:
-        ts = _parse_datetime(row.get("ts"))
-        domain = str(row.get("domain", "")).strip()
-        raw = str(row.get("raw", "")).strip()
-        reason = str(row.get("reason", "")).strip() or "unknown"
-        method = str(row.get("method", "")).strip() or "unknown"
-        conf = row.get("confidence")
+        try:
+            ts_value, domain_value, raw_value, reason_value, method_value, conf, normalized_key = (
+                _get_row_fields(row)
+            )
+        except KeyError:
+            ts_value, domain_value, raw_value, reason_value, method_value, conf, normalized_key = (
+                _get_row_fields(_ROW_DEFAULTS | row)
+            )
+        ts = _parse_datetime(ts_value)
+        domain = str(domain_value).strip()
+        raw = str(raw_value).strip()
+        reason = str(reason_value).strip() or "unknown"
+        method = str(method_value).strip() or "unknown"
         confidence = float(conf) if isinstance(conf, (int, float)) else 0.0
-        normalized_key = row.get("normalized_key")
         normalized_key = normalized_key if isinstance(normalized_key, str) else None
 
         if ts is None or ts < since_utc:
@@ -166,6 +193,8 @@ def _load_term_candidates(version: str) -> dict[str, list[str]]:
 
 
 def _find_typo_hint(raw: str, candidates: list[str]) -> tuple[str | None, float]:
+    from difflib import SequenceMatcher
+
     normalized_raw = _normalize_text(raw)
     best_match: str | None = None
     best_score = 0.0
@@ -177,7 +206,37 @@ def _find_typo_hint(raw: str, candidates: list[str]) -> tuple[str | None, float]
     return best_match, round(best_score, 4)
 
 
-def summarize(events: list[Event], *, top: int, dictionary_version: str) -> dict[str, Any]:
+def _typo_hints_for_domain(
+    domain: str,
+    raw_counts: list[tuple[str, int]],
+    candidates: list[str],
+) -> list[dict[str, Any]]:
+    hints: list[dict[str, Any]] = []
+    for raw, count in raw_counts:
+        best, score = _find_typo_hint(raw, candidates)
+        if best is None:
+            continue
+        if score < 0.88 or score >= 1.0:
+            continue
+        hints.append(
+            {
+                "domain": domain,
+                "raw": raw,
+                "count": count,
+                "suggested_term": best,
+                "score": score,
+            }
+        )
+    return hints
+
+
+def summarize(
+    events: list[Event],
+    *,
+    top: int,
+    dictionary_version: str,
+    workers: int = 1,
+) -> dict[str, Any]:
     domain_counts: Counter[str] = Counter()
     reason_counts: Counter[str] = Counter()
     method_counts: Counter[str] = Counter()
@@ -191,38 +250,39 @@ def summarize(events: list[Event], *, top: int, dictionary_version: str) -> dict
         method_counts[ev.method] += 1
         grouped_raw[ev.domain][ev.raw] += 1
         grouped_reason[ev.domain][ev.reason] += 1
-        if any(sep in ev.raw for sep in [",", "\n", ";", "/", "|", "·", "、"]):
+        if not COMPOUND_SEPARATORS.isdisjoint(ev.raw):
             compound_counts[ev.domain] += 1
 
     terms_by_domain = _load_term_candidates(dictionary_version)
+    jobs = [
+        (domain, counter.most_common(top * 3), terms_by_domain.get(domain, []))
+        for domain, counter in grouped_raw.items()
+    ]
     typo_hints: list[dict[str, Any]] = []
-    for domain, counter in grouped_raw.items():
-        for raw, count in counter.most_common(top * 3):
-            best, score = _find_typo_hint(raw, terms_by_domain.get(domain, []))
-            if best is None:
-                continue
-            if score < 0.88 or score >= 1.0:
-                continue
-            typo_hints.append(
-                {
-                    "domain": domain,
-                    "raw": raw,
-                    "count": count,
-                    "suggested_term": best,
-                    "score": score,
-                }
-            )
+    if workers > 1 and len(jobs) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Each domain scans its own candidates with pure-Python SequenceMatcher, so fan out
+        # across processes rather than threads.
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            for hints in executor.map(_typo_hints_for_domain, *zip(*jobs)):
+                typo_hints.extend(hints)
+    else:
+        for job in jobs:
+            typo_hints.extend(_typo_hints_for_domain(*job))
     typo_hints.sort(key=lambda x: (-x["count"], -x["score"], x["domain"], x["raw"]))
 
     top_by_domain: dict[str, list[dict[str, Any]]] = {}
     for domain in VALID_DOMAINS:
+        reasons = grouped_reason.get(domain)
+        top_reason = reasons.most_common(1)[0][0] if reasons else None
         rows: list[dict[str, Any]] = []
         for raw, count in grouped_raw.get(domain, Counter()).most_common(top):
             rows.append(
                 {
                     "raw": raw,
                     "count": count,
-                    "top_reason": grouped_reason[domain].most_common(1)[0][0] if grouped_reason[domain] else None,
+                    "top_reason": top_reason,
                 }
             )
         top_by_domain[domain] = rows
@@ -240,66 +300,66 @@ def summarize(events: list[Event], *, top: int, dictionary_version: str) -> dict
 
 
 def render_markdown(summary: dict[str, Any], *, days: int, source: str) -> str:
-    lines: list[str] = []
-    lines.append("# Unknown Queue Weekly Report")
-    lines.append("")
-    lines.append(f"- Window: last {days} days")
-    lines.append(f"- Source: `{source}`")
-    lines.append(f"- Total events: {summary['events']}")
-    lines.append(f"- Unique raw values: {summary['unique_raw']}")
-    lines.append("")
-
-    lines.append("## Domain Breakdown")
-    lines.append("")
-    lines.append("domain | events | compound_raw_events")
-    lines.append("--- | --- | ---")
+    buf = io.StringIO()
+    w = buf.write
+    w("# Unknown Queue Weekly Report\n")
+    w("\n")
+    w(f"- Window: last {days} days\n")
+    w(f"- Source: `{source}`\n")
+    w(f"- Total events: {summary['events']}\n")
+    w(f"- Unique raw values: {summary['unique_raw']}\n")
+    w("\n")
+
+    w("## Domain Breakdown\n")
+    w("\n")
+    w("domain | events | compound_raw_events\n")
+    w("--- | --- | ---\n")
     for domain in VALID_DOMAINS:
-        lines.append(
-            f"{domain} | {summary['domain_counts'].get(domain, 0)} | {summary['compound_counts'].get(domain, 0)}"
+        w(
+            f"{domain} | {summary['domain_counts'].get(domain, 0)} | {summary['compound_counts'].get(domain, 0)}\n"
         )
-    lines.append("")
+    w("\n")
 
-    lines.append("## Reasons")
-    lines.append("")
-    lines.append("reason | count")
-    lines.append("--- | ---")
+    w("## Reasons\n")
+    w("\n")
+    w("reason | count\n")
+    w("--- | ---\n")
     for reason, count in sorted(summary["reason_counts"].items(), key=lambda x: (-x[1], x[0])):
-        lines.append(f"{reason} | {count}")
-    lines.append("")
+        w(f"{reason} | {count}\n")
+    w("\n")
 
-    lines.append("## Top Unknown Values")
-    lines.append("")
+    w("## Top Unknown Values\n")
+    w("\n")
     for domain in VALID_DOMAINS:
         rows = summary["top_by_domain"].get(domain, [])
         if not rows:
             continue
-        lines.append(f"### {domain}")
-        lines.append("")
-        lines.append("count | raw")
-        lines.append("--- | ---")
+        w(f"### {domain}\n")
+        w("\n")
+        w("count | raw\n")
+        w("--- | ---\n")
         for row in rows:
-            lines.append(f"{row['count']} | {row['raw']}")
-        lines.append("")
+            w(f"{row['count']} | {row['raw']}\n")
+        w("\n")
 
-    lines.append("## Typo Hints (Review Required)")
-    lines.append("")
-    lines.append("domain | raw | count | suggested_term | score")
-    lines.append("--- | --- | --- | --- | ---")
+    w("## Typo Hints (Review Required)\n")
+    w("\n")
+    w("domain | raw | count | suggested_term | score\n")
+    w("--- | --- | --- | --- | ---\n")
     for row in summary["typo_hints"]:
-        lines.append(
-            f"{row['domain']} | {row['raw']} | {row['count']} | {row['suggested_term']} | {row['score']}"
+        w(
+            f"{row['domain']} | {row['raw']} | {row['count']} | {row['suggested_term']} | {row['score']}\n"
         )
     if not summary["typo_hints"]:
-        lines.append("(none)")
-    lines.append("")
+        w("(none)\n")
+    w("\n")
 
-    lines.append("## Recommended Actions")
-    lines.append("")
-    lines.append("- Split compound values at extraction/parsing stage when `compound_raw_events` grows.")
-    lines.append("- For `flavor_note`, keep strict mode and only add typo aliases after manual review.")
-    lines.append("- Promote high-frequency unknown terms to `terms.py` when they represent new canonical concepts.")
-    lines.append("")
-    return "\n".join(lines)
+    w("## Recommended Actions\n")
+    w("\n")
+    w("- Split compound values at extraction/parsing stage when `compound_raw_events` grows.\n")
+    w("- For `flavor_note`, keep strict mode and only add typo aliases after manual review.\n")
+    w("- Promote high-frequency unknown terms to `terms.py` when they represent new canonical concepts.\n")
+    return buf.getvalue()
 
 
 def main() -> int:
@@ -317,7 +377,12 @@ def main() -> int:
         rows = _load_postgres(args.database_url)
 
     events = _rows_to_events(rows, since_utc)
-    summary = summarize(events, top=args.top, dictionary_version=args.dictionary_version)
+    summary = summarize(
+        events,
+        top=args.top,
+        dictionary_version=args.dictionary_version,
+        workers=args.workers,
+    )
 
     if args.format == "json":
         output = json.dumps(
@@ -1,5 +1,10 @@
 """bean-lens: Extract structured coffee bean info from package or card images."""
 
+from dotenv import load_dotenv
+
+# Providers are imported lazily, so load `.env` here for settings read at import or call time.
+load_dotenv()
+
 from bean_lens.core import extract
 from bean_lens.normalization import NormalizedBeanInfo, normalize_bean_info
 from bean_lens.schema import BeanInfo, Origin
@@ -0,0 +1,122 @@
+"""Content-addressed caches for extraction results."""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 60 * 60
+
+
+class ExtractionCache:
+    """Store JSON extraction results on disk, keyed by image content hash.
+
+    Entries live at `<directory>/<key[:2]>/<key>.json` and expire after
+    `ttl_seconds`. Cache I/O failures are treated as misses so that a broken
+    cache never breaks extraction.
+    """
+
+    def __init__(self, directory: str | Path, *, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.directory = Path(directory).expanduser()
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                self.misses += 1
+                return None
+            value = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: dict) -> None:
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(value, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+
+class MemoryCache:
+    """Small thread-safe in-process LRU for results of recently seen images.
+
+    Providers consult it before the disk cache, so duplicate images within a
+    session skip both the API call and the disk read. Values are deep-copied on
+    the way in and out, so a caller mutating its result can't change the entry.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, object] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# One memory tier for every provider instance: the `extract` entry points build a new
+# provider per call, so a per-instance LRU would never be hit. Keys already name the
+# provider and model. Providers only use it when result caching is enabled.
+SHARED_MEMORY_CACHE = MemoryCache()
+
+
+def cache_key(content: bytes, *parts: str) -> str:
+    """Build a cache key from image bytes plus provider/model/prompt identifiers."""
+
+    digest = hashlib.blake2b(content, digest_size=16)
+    for part in parts:
+        digest.update(b"\0")
+        digest.update(part.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def default_cache() -> ExtractionCache | None:
+    """Return the cache configured by environment variables, if enabled.
+
+    `BEAN_LENS_CACHE_DIR` enables the cache at that directory. `BEAN_LENS_CACHE=true`
+    enables it at `$XDG_CACHE_HOME/bean_lens` (default `~/.cache/bean_lens`).
+    """
+
+    directory = os.getenv("BEAN_LENS_CACHE_DIR")
+    if not directory:
+        if os.getenv("BEAN_LENS_CACHE", "false").strip().lower() != "true":
+            return None
+        directory = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "bean_lens"
+    ttl = os.getenv("BEAN_LENS_CACHE_TTL_SEC")
+    return ExtractionCache(directory, ttl_seconds=float(ttl) if ttl else DEFAULT_TTL_SECONDS)
@@ -1,6 +1,13 @@
 """Normalization utilities for bean-lens."""
 
-from bean_lens.normalization.engine import NormalizationConfig, NormalizationEngine, normalize_bean_info
+from bean_lens.normalization.engine import (
+    NormalizationConfig,
+    NormalizationEngine,
+    UnknownWebhookBatch,
+    flush_unknown_webhooks,
+    normalize_bean_info,
+    track_unknown_webhooks,
+)
 from bean_lens.normalization.types import NormalizedBeanInfo, NormalizedItem
 
 __all__ = [
@@ -8,5 +15,8 @@ __all__ = [
     "NormalizationEngine",
     "NormalizedBeanInfo",
     "NormalizedItem",
+    "UnknownWebhookBatch",
+    "flush_unknown_webhooks",
     "normalize_bean_info",
+    "track_unknown_webhooks",
 ]
@@ -2,19 +2,54 @@
 
 from __future__ import annotations
 
+import atexit
+import contextvars
+import http.client
 import json
+import logging
+import os
+import queue
 import re
+import sys
+import threading
+import time
 import unicodedata
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
-from urllib import error, request
+from urllib import error, parse, request
 
 from bean_lens.schema import BeanInfo
 from bean_lens.normalization.repository import Alias, DictionaryRepository, Term
 from bean_lens.normalization.types import Domain, Method, NormalizedBeanInfo, NormalizedItem
 
+try:
+    from rapidfuzz import fuzz as rf_fuzz
+    from rapidfuzz import process as rf_process
+except ImportError:  # pragma: no cover - optional accelerator
+    rf_fuzz = None
+    rf_process = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD_RE = re.compile(r"[\W_]+")
+_MULTI_VALUE_SPLIT_RE = re.compile(r"[,\n;/|·、]+")
+_ANY_ALIAS_KIND = "*"
+_MATCH_CACHE_SIZE = 4096
+
+# Unknown-queue lines buffered while a normalize_bean_info call is in progress.
+_pending_unknown_lines: contextvars.ContextVar[list[bytes] | None] = contextvars.ContextVar(
+    "bean_lens_pending_unknown_lines", default=None
+)
+
 
 @dataclass(frozen=True)
 class MatchResult:
@@ -27,7 +62,7 @@ class MatchResult:
     reason: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NormalizationConfig:
     dictionary_version: str = "v2"
     fuzzy_threshold: float = 0.86
@@ -46,9 +81,57 @@ class NormalizationEngine:
     def __init__(self, config: NormalizationConfig | None = None):
         self.config = config or NormalizationConfig()
         self.repo = DictionaryRepository(version=self.config.dictionary_version)
+        self._unknown_queue_fd: int | None = None
+        self._unknown_queue_closer: weakref.finalize | None = None
+        self._unknown_queue_lock = threading.Lock()
         self._term_index = self._build_term_index()
+        self._exact_lookup, self._normalized_candidates = self._build_candidate_index()
+        self._alias_lookup, self._regex_aliases, self._contains_aliases = self._build_alias_index()
+        # Matching is pure, so repeated raw values reuse the result; unknown-queue writes
+        # stay in normalize_one and still happen on every call. A plain dict (rather than
+        # lru_cache over the bound method) keeps the engine free of reference cycles, so
+        # the unknown-queue finalizer runs as soon as the engine is dropped.
+        self._match_cache: dict[tuple[Domain, str], MatchResult | None] = {}
+        self._fuzzy_choices: dict[Domain, list[str]] = {
+            domain: [candidate for candidate, _ in pairs]
+            for domain, pairs in self._normalized_candidates.items()
+        }
+        # Per-candidate character bitmasks for the bit-parallel fallback when rapidfuzz is absent.
+        self._fuzzy_patterns: dict[Domain, list[tuple[dict[str, int], int, Term]]] = {
+            domain: [(_char_masks(candidate), len(candidate), term) for candidate, term in pairs]
+            for domain, pairs in self._normalized_candidates.items()
+        }
 
     def normalize_bean_info(self, bean: BeanInfo) -> NormalizedBeanInfo:
+        with self._buffered_unknown_lines():
+            return self._normalize_bean_info(bean)
+
+    def normalize_many(self, domain: Domain, raws: list[str | None]) -> list[NormalizedItem]:
+        """Normalize several raw values of one domain, returning one item per input.
+
+        Repeated values reuse the cached match, and the unknown-queue lines of the whole
+        batch are appended with a single write.
+        """
+
+        with self._buffered_unknown_lines():
+            return [self.normalize_one(domain, raw) for raw in raws]
+
+    @contextmanager
+    def _buffered_unknown_lines(self) -> Iterator[None]:
+        # Collect unknown-queue lines until the outermost batch ends, then write them at once.
+        if _pending_unknown_lines.get() is not None:
+            yield
+            return
+        pending_token = _pending_unknown_lines.set([])
+        try:
+            yield
+        finally:
+            lines = _pending_unknown_lines.get()
+            _pending_unknown_lines.reset(pending_token)
+            if lines:
+                self._append_unknown_lines(b"".join(lines))
+
+    def _normalize_bean_info(self, bean: BeanInfo) -> NormalizedBeanInfo:
         warnings: list[str] = []
 
         process = self.normalize_one("process", bean.process) if bean.process else None
@@ -90,30 +173,7 @@ class NormalizationEngine:
         if not value:
             return NormalizedItem(domain=domain, raw=raw, reason="empty_input")
 
-        if self._is_strict_flavor_note(domain):
-            match = (
-                self._match_exact(domain, value)
-                or self._match_alias(
-                    domain,
-                    value,
-                    allowed_match_types={"exact"},
-                    allowed_alias_kinds={"typo"},
-                )
-                or self._match_fuzzy(
-                    domain,
-                    value,
-                    threshold=self.config.flavor_note_fuzzy_threshold,
-                )
-            )
-        else:
-            match = (
-                self._match_exact(domain, value)
-                or self._match_alias(domain, value)
-                or self._match_regex(domain, value)
-                or self._match_contains(domain, value)
-                or self._match_fuzzy(domain, value)
-            )
-
+        match = self._cached_match(domain, value)
         if match:
             item = NormalizedItem(
                 domain=domain,
@@ -155,16 +215,56 @@ class NormalizationEngine:
             reason="no_dictionary_match",
         )
 
+    def _cached_match(self, domain: Domain, value: str) -> MatchResult | None:
+        key = (domain, value)
+        try:
+            return self._match_cache[key]
+        except KeyError:
+            pass
+        match = self._find_match(domain, value)
+        if len(self._match_cache) >= _MATCH_CACHE_SIZE:
+            self._match_cache.clear()
+        self._match_cache[key] = match
+        return match
+
+    def _find_match(self, domain: Domain, value: str) -> MatchResult | None:
+        # Regex aliases see the stripped raw value; every other stage shares one normalization.
+        normalized = _normalize_text(value)
+        if self._is_strict_flavor_note(domain):
+            return (
+                self._match_exact(domain, normalized)
+                or self._match_alias(domain, normalized, alias_kind="typo")
+                or self._match_fuzzy(
+                    domain,
+                    normalized,
+                    threshold=self.config.flavor_note_fuzzy_threshold,
+                )
+            )
+        return (
+            self._match_exact(domain, normalized)
+            or self._match_alias(domain, normalized)
+            or self._match_regex(domain, value)
+            or self._match_contains(domain, normalized)
+            or self._match_fuzzy(domain, normalized)
+        )
+
     def _normalize_list(self, domain: Domain, values: list[str]) -> list[NormalizedItem]:
         deduped: list[NormalizedItem] = []
         seen: set[str] = set()
-
-        expanded_values: list[str] = []
-        for raw in values:
-            expanded_values.extend(_split_multi_values(raw))
-
-        for raw in expanded_values:
-            item = self.normalize_one(domain, raw)
+        seen_raw: set[str] = set()
+
+        unique_values: list[str] = []
+        # Exact repeats of an input are dropped before splitting; dict.fromkeys keeps order.
+        for value in dict.fromkeys(values):
+            for raw in _split_multi_values(value):
+                # Case/punctuation variants of an earlier value ("Citrus", "CITRUS") resolve
+                # the same way, so skip them before matching.
+                normalized_raw = _normalize_text(raw)
+                if normalized_raw not in seen_raw:
+                    seen_raw.add(normalized_raw)
+                    unique_values.append(raw)
+
+        for item in self.normalize_many(domain, unique_values):
             dedupe_key = item.normalized_key or _normalize_text(item.raw)
             if dedupe_key in seen:
                 continue
@@ -185,86 +285,144 @@ class NormalizationEngine:
             index[term.domain][term.key] = term
         return index
 
-    def _match_exact(self, domain: Domain, raw: str) -> MatchResult | None:
-        normalized_raw = _normalize_text(raw)
-        for term in self.repo.terms_by_domain(domain):
-            candidates = [term.key, term.label_en, term.label_ko]
-            for candidate in candidates:
-                if normalized_raw == _normalize_text(candidate):
-                    return MatchResult(
-                        key=term.key,
-                        label_en=term.label_en,
-                        label_ko=term.label_ko,
-                        confidence=0.98,
-                        method="exact",
-                        candidates=[term.key],
-                    )
-        return None
+    def _build_candidate_index(
+        self,
+    ) -> tuple[dict[Domain, dict[str, MatchResult]], dict[Domain, list[tuple[str, Term]]]]:
+        exact_lookup: dict[Domain, dict[str, MatchResult]] = {
+            domain: {} for domain in self._term_index
+        }
+        normalized_candidates: dict[Domain, list[tuple[str, Term]]] = {
+            domain: [] for domain in self._term_index
+        }
+        for term in self.repo.terms:
+            exact_match = MatchResult(
+                key=term.key,
+                label_en=term.label_en,
+                label_ko=term.label_ko,
+                confidence=0.98,
+                method="exact",
+                candidates=[term.key],
+            )
+            for candidate in (term.key, term.label_en, term.label_ko):
+                normalized = _normalize_text(candidate)
+                # Earlier terms win, matching the original term-order scan.
+                exact_lookup[term.domain].setdefault(normalized, exact_match)
+                normalized_candidates[term.domain].append((normalized, term))
+        return exact_lookup, normalized_candidates
+
+    def _build_alias_index(
+        self,
+    ) -> tuple[
+        dict[Domain, dict[str, dict[str, Alias]]],
+        dict[Domain, tuple[tuple[re.Pattern[str], Alias], ...]],
+        dict[Domain, tuple[tuple[str, Alias], ...]],
+    ]:
+        # domain -> alias kind (or _ANY_ALIAS_KIND) -> normalized text -> highest-priority alias
+        alias_lookup: dict[Domain, dict[str, dict[str, Alias]]] = {
+            domain: {} for domain in self._term_index
+        }
+        regex_aliases: dict[Domain, list[tuple[re.Pattern[str], Alias]]] = {
+            domain: [] for domain in self._term_index
+        }
+        contains_aliases: dict[Domain, list[tuple[str, Alias]]] = {
+            domain: [] for domain in self._term_index
+        }
+        # Sort once here so the match stages never sort; a stable sort keeps file order among
+        # aliases with the same priority.
+        for alias in sorted(self.repo.aliases, key=lambda item: item.priority):
+            if alias.match_type == "exact":
+                alias_text = _normalize_text(alias.alias)
+                by_kind = alias_lookup[alias.domain]
+                by_kind.setdefault(_ANY_ALIAS_KIND, {}).setdefault(alias_text, alias)
+                by_kind.setdefault(alias.alias_kind, {}).setdefault(alias_text, alias)
+            elif alias.match_type == "regex":
+                pattern = re.compile(alias.alias, flags=re.IGNORECASE)
+                regex_aliases[alias.domain].append((pattern, alias))
+            elif alias.match_type == "contains":
+                contains_aliases[alias.domain].append((_normalize_text(alias.alias), alias))
+        return (
+            alias_lookup,
+            {domain: tuple(items) for domain, items in regex_aliases.items()},
+            {domain: tuple(items) for domain, items in contains_aliases.items()},
+        )
+
+    def _match_exact(self, domain: Domain, normalized_raw: str) -> MatchResult | None:
+        return self._exact_lookup[domain].get(normalized_raw)
 
     def _match_alias(
         self,
         domain: Domain,
-        raw: str,
+        normalized_raw: str,
         *,
-        allowed_match_types: set[str] | None = None,
-        allowed_alias_kinds: set[str] | None = None,
+        alias_kind: str = _ANY_ALIAS_KIND,
     ) -> MatchResult | None:
-        normalized_raw = _normalize_text(raw)
-        aliases = sorted(
-            [
-                a
-                for a in self.repo.aliases_by_domain(domain)
-                if a.match_type == "exact"
-                and (allowed_match_types is None or a.match_type in allowed_match_types)
-                and (allowed_alias_kinds is None or a.alias_kind in allowed_alias_kinds)
-            ],
-            key=lambda item: item.priority,
-        )
-        for alias in aliases:
-            if normalized_raw == _normalize_text(alias.alias):
-                return self._match_from_alias(alias, confidence=0.9, method="alias")
-        return None
+        alias = self._alias_lookup[domain].get(alias_kind, {}).get(normalized_raw)
+        if alias is None:
+            return None
+        return self._match_from_alias(alias, confidence=0.9, method="alias")
 
     def _match_regex(self, domain: Domain, raw: str) -> MatchResult | None:
-        aliases = sorted(
-            [a for a in self.repo.aliases_by_domain(domain) if a.match_type == "regex"],
-            key=lambda item: item.priority,
-        )
-        for alias in aliases:
-            if re.search(alias.alias, raw, flags=re.IGNORECASE):
+        for pattern, alias in self._regex_aliases[domain]:
+            if pattern.search(raw):
                 return self._match_from_alias(alias, confidence=0.88, method="regex")
         return None
 
-    def _match_contains(self, domain: Domain, raw: str) -> MatchResult | None:
-        normalized_raw = _normalize_text(raw)
-        aliases = sorted(
-            [a for a in self.repo.aliases_by_domain(domain) if a.match_type == "contains"],
-            key=lambda item: item.priority,
-        )
-        for alias in aliases:
-            if _normalize_text(alias.alias) in normalized_raw:
+    def _match_contains(self, domain: Domain, normalized_raw: str) -> MatchResult | None:
+        for alias_text, alias in self._contains_aliases[domain]:
+            if alias_text in normalized_raw:
                 return self._match_from_alias(alias, confidence=0.86, method="alias")
         return None
 
     def _match_fuzzy(
         self,
         domain: Domain,
-        raw: str,
+        normalized_raw: str,
         *,
         threshold: float | None = None,
     ) -> MatchResult | None:
-        normalized_raw = _normalize_text(raw)
+        resolved_threshold = threshold if threshold is not None else self.config.fuzzy_threshold
         best_ratio = 0.0
         best_term: Term | None = None
 
-        for term in self.repo.terms_by_domain(domain):
-            for candidate in (term.key, term.label_en, term.label_ko):
-                ratio = SequenceMatcher(None, normalized_raw, _normalize_text(candidate)).ratio()
+        if rf_process is not None:
+            found = rf_process.extractOne(
+                normalized_raw,
+                self._fuzzy_choices[domain],
+                scorer=rf_fuzz.ratio,
+                score_cutoff=resolved_threshold * 100,
+            )
+            if found is not None:
+                _, score, index = found
+                best_ratio = score / 100
+                best_term = self._normalized_candidates[domain][index][1]
+        else:
+            # Same score as rapidfuzz's fuzz.ratio: 2 * LCS / (len(a) + len(b)).
+            query_length = len(normalized_raw)
+            query_counts = _char_counts(normalized_raw)
+            for masks, length, term in self._fuzzy_patterns[domain]:
+                total = query_length + length
+                # 2 * min(len) / total bounds the ratio from above, so candidates that
+                # cannot pass the threshold or beat the best are skipped.
+                floor = max(best_ratio, resolved_threshold)
+                if 2 * min(query_length, length) < floor * total:
+                    continue
+                # Shared character counts also bound the LCS and are cheaper than computing it.
+                shared = 0
+                for char, count in query_counts.items():
+                    mask = masks.get(char)
+                    if mask:
+                        shared += min(count, mask.bit_count())
+                if 2 * shared < floor * total:
+                    continue
+                if not total:
+                    ratio = 1.0
+                else:
+                    lcs = _lcs_length(masks, length, normalized_raw, minimum=floor * total / 2)
+                    ratio = 2 * lcs / total
                 if ratio > best_ratio:
                     best_ratio = ratio
                     best_term = term
 
-        resolved_threshold = threshold if threshold is not None else self.config.fuzzy_threshold
         if best_term and best_ratio >= resolved_threshold:
             confidence = max(0.7, min(0.85, round(best_ratio, 2)))
             return MatchResult(
@@ -303,7 +461,7 @@ class NormalizationEngine:
         normalized_key: str | None,
     ) -> None:
         payload = {
-            "ts": datetime.now(timezone.utc).isoformat(),
+            "ts": _utc_now_iso(),
             "domain": domain,
             "raw": raw,
             "confidence": confidence,
@@ -312,22 +470,43 @@ class NormalizationEngine:
             "normalized_key": normalized_key,
             "dictionary_version": self.config.dictionary_version,
         }
-        path_value = self.config.unknown_queue_path
-        if path_value:
-            path = Path(path_value)
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        if self.config.unknown_queue_path:
+            line = _json_bytes(payload) + b"\n"
+            pending = _pending_unknown_lines.get()
+            if pending is not None:
+                pending.append(line)
+            else:
+                self._append_unknown_lines(line)
 
         webhook_url = self.config.unknown_queue_webhook_url
         if webhook_url:
-            _send_unknown_webhook(
+            _submit_unknown_webhook(
                 webhook_url,
                 payload,
                 timeout_sec=self.config.unknown_queue_webhook_timeout_sec,
                 token=self.config.unknown_queue_webhook_token,
             )
 
+    def _append_unknown_lines(self, data: bytes) -> None:
+        # One O_APPEND descriptor per engine, so each flush lands as whole lines without
+        # reopening the file. It is checked against the path on every flush and reopened
+        # when the queue file was rotated, moved or deleted; writing under the same lock
+        # keeps another thread from closing it mid-write.
+        with self._unknown_queue_lock:
+            fd = self._unknown_queue_fd
+            path = Path(self.config.unknown_queue_path)
+            if fd is None or not _is_same_file(fd, path):
+                if self._unknown_queue_closer is not None:
+                    self._unknown_queue_closer()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                self._unknown_queue_closer = weakref.finalize(self, os.close, fd)
+                self._unknown_queue_fd = fd
+            # os.write may write only part of a large batch (e.g. on signals or full disks).
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+
 
 def normalize_bean_info(
     bean: BeanInfo,
@@ -344,8 +523,8 @@ def normalize_bean_info(
 ) -> NormalizedBeanInfo:
     """Normalize extracted BeanInfo using dictionary-based rules."""
 
-    engine = NormalizationEngine(
-        config=NormalizationConfig(
+    engine = _get_engine(
+        NormalizationConfig(
             dictionary_version=dictionary_version,
             fuzzy_threshold=fuzzy_threshold,
             flavor_note_mode=flavor_note_mode,
@@ -360,6 +539,139 @@ def normalize_bean_info(
     return engine.normalize_bean_info(bean)
 
 
+@lru_cache(maxsize=8)
+def _get_engine(config: NormalizationConfig) -> NormalizationEngine:
+    # Engines are read-only after construction, so one per config can be shared.
+    return NormalizationEngine(config=config)
+
+
+_WEBHOOK_QUEUE_MAXSIZE = 1000
+_webhook_queue: queue.Queue[tuple[str, dict, float, str | None, threading.Event | None]] = (
+    queue.Queue(maxsize=_WEBHOOK_QUEUE_MAXSIZE)
+)
+_webhook_worker: threading.Thread | None = None
+_webhook_worker_lock = threading.Lock()
+
+
+class UnknownWebhookBatch:
+    """Unknown-queue webhooks submitted inside a `track_unknown_webhooks()` block."""
+
+    def __init__(self) -> None:
+        self._attempted: list[threading.Event] = []
+
+    def __len__(self) -> int:
+        return len(self._attempted)
+
+    def wait(self, timeout_per_item: float | None = None) -> bool:
+        """Wait until the worker has attempted every webhook in this batch.
+
+        The total budget is `timeout_per_item` times the number of webhooks. Returns
+        False if it ran out first.
+        """
+
+        deadline = (
+            None
+            if timeout_per_item is None
+            else time.monotonic() + timeout_per_item * len(self._attempted)
+        )
+        for attempted in self._attempted:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not attempted.wait(remaining):
+                return False
+        return True
+
+
+_tracked_webhooks: contextvars.ContextVar[UnknownWebhookBatch | None] = contextvars.ContextVar(
+    "bean_lens_tracked_webhooks", default=None
+)
+
+
+@contextmanager
+def track_unknown_webhooks() -> Iterator[UnknownWebhookBatch]:
+    """Collect the unknown-queue webhooks submitted inside the block.
+
+    Webhooks are delivered from a background thread. Callers that must not return
+    before their own webhooks went out (e.g. serverless handlers, which may be frozen
+    after responding) wait on the yielded batch instead of the whole process queue.
+    """
+
+    batch = UnknownWebhookBatch()
+    token = _tracked_webhooks.set(batch)
+    try:
+        yield batch
+    finally:
+        _tracked_webhooks.reset(token)
+
+
+def flush_unknown_webhooks(timeout: float | None = None) -> bool:
+    """Wait until queued unknown-queue webhooks are delivered.
+
+    Returns False if the timeout elapsed before the queue drained.
+    """
+
+    joiner = threading.Thread(target=_webhook_queue.join, name="bean-lens-webhook-flush", daemon=True)
+    joiner.start()
+    joiner.join(timeout)
+    return not joiner.is_alive()
+
+
+def _submit_unknown_webhook(
+    url: str,
+    payload: dict,
+    *,
+    timeout_sec: float,
+    token: str | None,
+) -> None:
+    _ensure_webhook_worker()
+    batch = _tracked_webhooks.get()
+    attempted = threading.Event() if batch is not None else None
+    try:
+        _webhook_queue.put_nowait((url, payload, timeout_sec, token, attempted))
+    except queue.Full:
+        # Unknown queue is best-effort; drop rather than block extraction under backpressure.
+        logger.warning(
+            "unknown-queue webhook backlog is full (%d pending); dropped %s record %r",
+            _WEBHOOK_QUEUE_MAXSIZE,
+            payload.get("domain"),
+            payload.get("raw"),
+        )
+        return
+    if batch is not None:
+        batch._attempted.append(attempted)
+
+
+def _ensure_webhook_worker() -> None:
+    global _webhook_worker
+    if _webhook_worker is not None and _webhook_worker.is_alive():
+        return
+    with _webhook_worker_lock:
+        if _webhook_worker is not None and _webhook_worker.is_alive():
+            return
+        if _webhook_worker is None:
+            atexit.register(flush_unknown_webhooks, timeout=5.0)
+        _webhook_worker = threading.Thread(
+            target=_drain_webhook_queue,
+            name="bean-lens-unknown-webhook",
+            daemon=True,
+        )
+        _webhook_worker.start()
+
+
+def _drain_webhook_queue() -> None:
+    while True:
+        url, payload, timeout_sec, token, attempted = _webhook_queue.get()
+        try:
+            _send_unknown_webhook(url, payload, timeout_sec=timeout_sec, token=token)
+        except Exception:
+            # Delivery errors are handled in _send_unknown_webhook; anything else is a bug,
+            # but the worker must survive it to keep draining the queue.
+            logger.exception("unexpected error delivering unknown-queue webhook")
+        finally:
+            if attempted is not None:
+                attempted.set()
+            _webhook_queue.task_done()
+
+
 def _send_unknown_webhook(
     url: str,
     payload: dict,
@@ -367,30 +679,175 @@ def _send_unknown_webhook(
     timeout_sec: float,
     token: str | None,
 ) -> None:
-    data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    data = _json_bytes(payload)
     headers = {"Content-Type": "application/json"}
     if token:
         headers["x-webhook-token"] = token
-    req = request.Request(
-        url,
-        data=data,
-        headers=headers,
-        method="POST",
-    )
     try:
-        with request.urlopen(req, timeout=timeout_sec):
-            pass
-    except (error.URLError, TimeoutError, ValueError):
+        for _ in range(_WEBHOOK_MAX_REDIRECTS + 1):
+            parts = parse.urlsplit(url)
+            if parts.scheme not in {"http", "https"} or not parts.hostname:
+                raise ValueError(f"Unsupported webhook URL: {url}")
+            if parts.scheme in request.getproxies() and not request.proxy_bypass(parts.hostname):
+                # Proxied endpoints keep going through urllib, which handles proxy setup.
+                req = request.Request(url, data=data, headers=headers, method="POST")
+                with request.urlopen(req, timeout=timeout_sec):
+                    pass
+                return
+            status, location = _post_keep_alive(parts, data, headers, timeout_sec)
+            if not 300 <= status < 400:
+                return
+            if status not in {307, 308} or not location:
+                # Other redirects would turn the POST into a GET and lose the record.
+                logger.warning(
+                    "unknown-queue webhook %s answered %d; redirect not followed", url, status
+                )
+                return
+            next_url = parse.urljoin(url, location)
+            if parse.urlsplit(next_url).netloc != parts.netloc:
+                headers.pop("x-webhook-token", None)
+            url = next_url
+        logger.warning(
+            "unknown-queue webhook gave up after %d redirects at %s", _WEBHOOK_MAX_REDIRECTS, url
+        )
+    except (error.URLError, http.client.HTTPException, OSError, ValueError):
         # Unknown queue should never break extraction path.
         return
 
 
+_WEBHOOK_MAX_REDIRECTS = 5
+
+# Keep-alive connections per (scheme, host:port), reused so bursts of unknown items share
+# one TCP/TLS connection instead of reconnecting. The dict is not locked: only the webhook
+# worker thread (_drain_webhook_queue) may call _post_keep_alive.
+_webhook_connections: dict[tuple[str, str], http.client.HTTPConnection] = {}
+
+
+def _post_keep_alive(
+    parts: parse.SplitResult,
+    data: bytes,
+    headers: dict[str, str],
+    timeout_sec: float,
+) -> tuple[int, str | None]:
+    """POST on a pooled connection and return the status and Location header.
+
+    Must only be called from the webhook worker thread.
+    """
+
+    target = parts.path or "/"
+    if parts.query:
+        target = f"{target}?{parts.query}"
+    origin = (parts.scheme, parts.netloc)
+    conn = _webhook_connections.get(origin)
+    reused = conn is not None
+    if conn is None:
+        connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        conn = connection_class(parts.hostname, parts.port, timeout=timeout_sec)
+        _webhook_connections[origin] = conn
+    conn.timeout = timeout_sec
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout_sec)
+    try:
+        conn.request("POST", target, body=data, headers=headers)
+        with conn.getresponse() as response:
+            response.read()
+            return response.status, response.getheader("Location")
+    except (http.client.HTTPException, OSError) as e:
+        conn.close()
+        del _webhook_connections[origin]
+        # A reset on a reused connection means the server dropped it while idle; retry
+        # once on a fresh connection. Timeouts are not retried to avoid duplicate posts.
+        if not reused or not isinstance(e, (ConnectionResetError, BrokenPipeError)):
+            raise
+        return _post_keep_alive(parts, data, headers, timeout_sec)
+
+
+def _is_same_file(fd: int, path: Path) -> bool:
+    try:
+        current = os.stat(path)
+    except FileNotFoundError:
+        return False
+    opened = os.fstat(fd)
+    return (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino)
+
+
+def _json_bytes(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+_ts_prefix: tuple[int, str] = (-1, "")
+
+
+def _utc_now_iso() -> str:
+    """Return the current UTC time in datetime.isoformat() form.
+
+    The second-resolution prefix is formatted once per second and reused.
+    """
+
+    global _ts_prefix
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _ts_prefix
+    if seconds != cached_seconds:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _ts_prefix = (seconds, prefix)
+    micros = nanos // 1000
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    return f"{prefix}+00:00"
+
+
+def _char_counts(text: str) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for char in text:
+        counts[char] = counts.get(char, 0) + 1
+    return counts
+
+
+def _char_masks(text: str) -> dict[str, int]:
+    masks: dict[str, int] = {}
+    for position, char in enumerate(text):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+
+def _lcs_length(masks: dict[str, int], length: int, text: str, minimum: float = 0) -> int:
+    """Longest common subsequence of `text` and the string described by `masks`.
+
+    Bit-parallel (Allison-Dix/Hyyrö): one pass over `text`, updating a bit row of
+    the DP matrix with integer operations instead of filling it cell by cell.
+    Returns 0 as soon as the result can no longer reach `minimum`.
+    """
+    all_ones = (1 << length) - 1
+    row = all_ones
+    remaining = len(text)
+    for char in text:
+        matches = row & masks.get(char, 0)
+        row = ((row + matches) | (row - matches)) & all_ones
+        remaining -= 1
+        # Each remaining character can extend the LCS by at most one.
+        if length - row.bit_count() + remaining < minimum:
+            return 0
+    return length - row.bit_count()
+
+
+@lru_cache(maxsize=8192)
 def _normalize_text(value: str) -> str:
-    text = unicodedata.normalize("NFKC", value).lower().strip()
-    text = text.replace("_", " ").replace("-", " ")
-    text = re.sub(r"[^\w\s]", " ", text)
-    text = re.sub(r"\s+", " ", text)
-    return text
+    # NFKC leaves ASCII untouched, and the quick check avoids rebuilding already-normalized text.
+    if value.isascii() or unicodedata.is_normalized("NFKC", value):
+        text = value
+    else:
+        text = unicodedata.normalize("NFKC", value)
+    text = text.lower().strip()
+    # Punctuation, "_" and whitespace all collapse to a single space in one pass. Single
+    # words (isalnum is exactly the regex's \w minus "_") have nothing to collapse.
+    if not text.isalnum():
+        text = _NON_WORD_RE.sub(" ", text)
+    # Interned, so probes into the index dicts (built from interned keys) match by identity.
+    return sys.intern(text)
 
 
 def _split_multi_values(value: str) -> list[str]:
@@ -399,6 +856,6 @@ def _split_multi_values(value: str) -> list[str]:
         return []
 
     # OCR/LLM 결과에서 flavor/value가 한 줄로 합쳐지는 경우를 분해한다.
-    tokens = re.split(r"[,\n;/|·、]+", text)
+    tokens = _MULTI_VALUE_SPLIT_RE.split(text)
     items = [token.strip() for token in tokens if token.strip()]
     return items or [text]
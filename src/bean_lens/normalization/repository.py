@@ -10,7 +10,7 @@ from importlib import import_module
 from bean_lens.normalization.types import Domain
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Term:
     domain: Domain
     key: str
@@ -18,7 +18,7 @@ class Term:
     label_ko: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Alias:
     domain: Domain
     key: str
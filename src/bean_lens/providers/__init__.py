@@ -1,7 +1,22 @@
 """Providers for bean-lens."""
 
+from importlib import import_module
+
 from bean_lens.providers.base import BaseProvider
-from bean_lens.providers.gemini import GeminiProvider
-from bean_lens.providers.google_vision_ocr import GoogleVisionOCRProvider
 
 __all__ = ["BaseProvider", "GeminiProvider", "GoogleVisionOCRProvider"]
+
+# Provider SDKs are slow to import, so concrete providers load on first attribute access.
+_LAZY_PROVIDERS = {
+    "GeminiProvider": "bean_lens.providers.gemini",
+    "GoogleVisionOCRProvider": "bean_lens.providers.google_vision_ocr",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,6 +1,9 @@
 """Base provider interface."""
 
+import asyncio
+import random
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from PIL import Image
@@ -9,6 +12,14 @@ from bean_lens.schema import BeanInfo
 
 ImageInput = str | Path | Image.Image
 
+# File suffixes whose bytes providers can send as-is, without a PIL decode/re-encode.
+RAW_IMAGE_MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".webp": "image/webp",
+}
+
 
 class BaseProvider(ABC):
     """Abstract base class for LLM providers."""
@@ -25,6 +36,75 @@ class BaseProvider(ABC):
         """
         pass
 
+    def _prepare(self, image: ImageInput):
+        """CPU stage of an extraction: load/encode the image for the request.
+
+        The default passes the input through unchanged.
+        """
+        return image
+
+    async def _aextract_prepared(self, prepared) -> BeanInfo:
+        """Network stage of an extraction, given the output of `_prepare`.
+
+        The default runs `extract` in a worker thread.
+        """
+        return await asyncio.to_thread(self.extract, prepared)
+
+    async def aextract(self, image: ImageInput) -> BeanInfo:
+        """Extract bean info without blocking the event loop."""
+        prepared = await asyncio.to_thread(self._prepare, image)
+        return await self._aextract_prepared(prepared)
+
+    async def aextract_many(
+        self,
+        images: list[ImageInput],
+        *,
+        concurrency: int = 8,
+        stagger: float = 0.05,
+        cpu_workers: int | None = None,
+    ) -> list[BeanInfo]:
+        """Extract bean info from many images concurrently.
+
+        Images are prepared (loaded/encoded) on a CPU thread pool and sent on a
+        separate set of network slots, so encoding later images overlaps the
+        requests for earlier ones instead of all images hitting each phase at
+        once. At most `2 * concurrency` images are between the two stages.
+
+        Args:
+            images: Image inputs to extract.
+            concurrency: Maximum number of in-flight requests.
+            stagger: Upper bound (seconds) of the random delay before each
+                request, so submissions don't hit the API in lockstep.
+            cpu_workers: Threads used for the prepare stage. Defaults to the
+                ThreadPoolExecutor default.
+
+        Returns:
+            BeanInfo results in input order.
+        """
+        concurrency = max(1, concurrency)
+        loop = asyncio.get_running_loop()
+        window = asyncio.Semaphore(2 * concurrency)
+        network = asyncio.Semaphore(concurrency)
+        cpu_pool = ThreadPoolExecutor(max_workers=cpu_workers)
+
+        async def run(image: ImageInput) -> BeanInfo:
+            async with window:
+                prepared = await loop.run_in_executor(cpu_pool, self._prepare, image)
+                async with network:
+                    if stagger > 0:
+                        await asyncio.sleep(random.uniform(0, stagger))
+                    return await self._aextract_prepared(prepared)
+
+        tasks = [asyncio.ensure_future(run(image)) for image in images]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            cpu_pool.shutdown(wait=False, cancel_futures=True)
+
     def get_extraction_metadata(self) -> dict[str, str]:
         """Return provider-specific extraction metadata."""
         return {}
@@ -1,5 +1,6 @@
 """Gemini provider implementation."""
 
+import hashlib
 import os
 from pathlib import Path
 
@@ -10,8 +11,9 @@ load_dotenv()
 from google.genai import types
 from PIL import Image
 
+from bean_lens.cache import SHARED_MEMORY_CACHE, ExtractionCache, cache_key, default_cache
 from bean_lens.exceptions import AuthenticationError, ImageError, RateLimitError
-from bean_lens.providers.base import BaseProvider, ImageInput
+from bean_lens.providers.base import RAW_IMAGE_MIME_TYPES, BaseProvider, ImageInput
 from bean_lens.schema import BeanInfo
 
 EXTRACTION_PROMPT = """Analyze this coffee bean package or card image and extract the following information.
@@ -37,16 +39,26 @@ Important:
 - Only include information clearly visible in the image
 - Return valid JSON only, no additional text"""
 
+_PROMPT_DIGEST = hashlib.blake2b(EXTRACTION_PROMPT.encode("utf-8"), digest_size=8).hexdigest()
+
 
 class GeminiProvider(BaseProvider):
     """Gemini Vision API provider."""
 
-    def __init__(self, api_key: str | None = None, model: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str = "gemini-2.5-flash",
+        *,
+        cache: ExtractionCache | None = None,
+    ):
         """Initialize Gemini provider.
 
         Args:
             api_key: Gemini API key. Falls back to GEMINI_API_KEY env var.
             model: Model name to use.
+            cache: Result cache keyed by image content. Falls back to the
+                cache configured via BEAN_LENS_CACHE / BEAN_LENS_CACHE_DIR.
 
         Raises:
             AuthenticationError: If no API key is provided or found.
@@ -59,6 +71,13 @@ class GeminiProvider(BaseProvider):
             )
         self.model = model
         self.client = genai.Client(api_key=self.api_key)
+        self.cache = cache if cache is not None else default_cache()
+        self._memory_cache = SHARED_MEMORY_CACHE
+        # The request config is identical for every call, so build it once.
+        self._generate_config = types.GenerateContentConfig(
+            response_mime_type="application/json",
+            response_schema=BeanInfo,
+        )
 
     def _load_image(self, image: ImageInput) -> Image.Image:
         """Load image from various input types."""
@@ -66,14 +85,28 @@ class GeminiProvider(BaseProvider):
             return image
 
         path = Path(image) if isinstance(image, str) else image
-        if not path.exists():
-            raise ImageError(f"Image file not found: {path}")
-
+        # Let open() report a missing file instead of paying for a separate stat call.
         try:
             return Image.open(path)
+        except FileNotFoundError as e:
+            raise ImageError(f"Image file not found: {path}") from e
         except Exception as e:
             raise ImageError(f"Failed to open image: {e}") from e
 
+    def _load_image_part(self, image: ImageInput) -> Image.Image | types.Part:
+        """Load image as request content, passing supported files through as raw bytes."""
+        if not isinstance(image, Image.Image):
+            path = Path(image)
+            mime_type = RAW_IMAGE_MIME_TYPES.get(path.suffix.lower())
+            if mime_type is not None:
+                try:
+                    return types.Part.from_bytes(data=path.read_bytes(), mime_type=mime_type)
+                except FileNotFoundError as e:
+                    raise ImageError(f"Image file not found: {path}") from e
+                except OSError as e:
+                    raise ImageError(f"Failed to open image: {e}") from e
+        return self._load_image(image)
+
     def extract(self, image: ImageInput) -> BeanInfo:
         """Extract bean info from an image using Gemini Vision.
 
@@ -88,38 +121,120 @@ class GeminiProvider(BaseProvider):
             RateLimitError: If API rate limit is exceeded
             AuthenticationError: If API key is invalid
         """
-        pil_image = self._load_image(image)
+        image_part, key = self._prepare(image)
+        if (cached := self._cached_result(key)) is not None:
+            return cached
 
         try:
             response = self.client.models.generate_content(
                 model=self.model,
-                contents=[pil_image, EXTRACTION_PROMPT],
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    response_schema=BeanInfo,
-                ),
+                contents=[image_part, EXTRACTION_PROMPT],
+                config=self._generate_config,
+            )
+            result = BeanInfo.model_validate_json(response.text)
+
+        except genai.errors.ClientError as e:
+            _raise_client_error(e)
+            raise
+        except Exception as e:
+            raise ImageError(f"Failed to extract info: {e}") from e
+
+        self._store_result(key, result)
+        return result
+
+    def _prepare(self, image: ImageInput) -> tuple[Image.Image | types.Part, str | None]:
+        image_part = self._load_image_part(image)
+        # Results are only cached (in memory and on disk) once caching is enabled, so
+        # don't pay for hashing the image otherwise.
+        if self.cache is None:
+            return image_part, None
+        try:
+            return image_part, self._cache_key(image_part)
+        except Exception as e:
+            raise ImageError(f"Failed to extract info: {e}") from e
+
+    async def _aextract_prepared(
+        self, prepared: tuple[Image.Image | types.Part, str | None]
+    ) -> BeanInfo:
+        """Send a prepared image with the async Gemini client."""
+        image_part, key = prepared
+        if (cached := self._cached_result(key)) is not None:
+            return cached
+
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=self.model,
+                contents=[image_part, EXTRACTION_PROMPT],
+                config=self._generate_config,
             )
-            return BeanInfo.model_validate_json(response.text)
+            result = BeanInfo.model_validate_json(response.text)
 
         except genai.errors.ClientError as e:
-            message = str(e).lower()
-            status_code = getattr(e, "status_code", None)
-            code = getattr(e, "code", None)
-            if (
-                status_code == 429
-                or code == 429
-                or "429" in message
-                or "rate" in message
-                or "quota" in message
-                or "resource_exhausted" in message
-                or "too many requests" in message
-            ):
-                raise RateLimitError(f"API rate limit exceeded: {e}") from e
-            if status_code == 401 or status_code == 403 or "auth" in message or "key" in message:
-                raise AuthenticationError(f"Invalid API key: {e}") from e
+            _raise_client_error(e)
             raise
         except Exception as e:
             raise ImageError(f"Failed to extract info: {e}") from e
 
+        self._store_result(key, result)
+        return result
+
+    def _cache_key(self, image_part: Image.Image | types.Part) -> str:
+        if isinstance(image_part, types.Part):
+            blob = image_part.inline_data
+            return cache_key(blob.data, "gemini", self.model, _PROMPT_DIGEST, blob.mime_type or "")
+        return cache_key(
+            image_part.tobytes(),
+            "gemini",
+            self.model,
+            _PROMPT_DIGEST,
+            image_part.mode,
+            str(image_part.size),
+        )
+
+    def _cached_result(self, key: str | None) -> BeanInfo | None:
+        if key is None:
+            return None
+        if (result := self._memory_cache.get(key)) is not None:
+            return result
+        if self.cache is None or (stored := self.cache.get(key)) is None:
+            return None
+        try:
+            result = BeanInfo.model_validate(stored)
+        except ValueError:
+            # A stale or corrupt entry counts as a miss, like unreadable cache files.
+            return None
+        self._memory_cache.set(key, result)
+        return result
+
+    def _store_result(self, key: str | None, result: BeanInfo) -> None:
+        if key is None:
+            return
+        self._memory_cache.set(key, result)
+        if self.cache is not None:
+            self.cache.set(key, result.model_dump(mode="json", exclude_none=True))
+
     def get_extraction_metadata(self) -> dict[str, str]:
         return {"provider": "gemini", "parser": "gemini_vision"}
+
+
+def _raise_client_error(e: Exception) -> None:
+    """Map rate-limit and auth client errors to bean-lens exceptions."""
+    status_code = getattr(e, "status_code", None)
+    code = getattr(e, "code", None)
+    if status_code == 429 or code == 429:
+        raise RateLimitError(f"API rate limit exceeded: {e}") from e
+    if status_code in {401, 403} or code in {401, 403}:
+        raise AuthenticationError(f"Invalid API key: {e}") from e
+
+    # Fall back to sniffing the message for wrappers that don't carry a status code.
+    message = str(e).lower()
+    if (
+        "429" in message
+        or "rate" in message
+        or "quota" in message
+        or "resource_exhausted" in message
+        or "too many requests" in message
+    ):
+        raise RateLimitError(f"API rate limit exceeded: {e}") from e
+    if "auth" in message or "key" in message:
+        raise AuthenticationError(f"Invalid API key: {e}") from e
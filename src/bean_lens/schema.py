@@ -1,11 +1,13 @@
 """Data models for bean-lens."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Origin(BaseModel):
     """Origin information of coffee beans."""
 
+    model_config = ConfigDict(frozen=True)
+
     country: str | None = None
     region: str | None = None
     farm: str | None = None
@@ -14,6 +16,8 @@ class Origin(BaseModel):
 class BeanInfo(BaseModel):
     """Structured information extracted from coffee bean package."""
 
+    model_config = ConfigDict(frozen=True)
+
     roastery: str | None = None
     name: str | None = None
     origin: Origin | None = None
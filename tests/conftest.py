@@ -0,0 +1,16 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from bean_lens.cache import SHARED_MEMORY_CACHE
+from bean_lens.providers import google_vision_ocr
+
+
+@pytest.fixture(autouse=True)
+def _clear_shared_caches():
+    # Provider results and LLM parses are memoized process-wide; keep tests independent.
+    SHARED_MEMORY_CACHE.clear()
+    google_vision_ocr._LLM_PARSE_CACHE.clear()
+    yield
+    SHARED_MEMORY_CACHE.clear()
+    google_vision_ocr._LLM_PARSE_CACHE.clear()
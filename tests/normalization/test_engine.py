@@ -1,6 +1,10 @@
 """Tests for normalization engine."""
 
+import gc
 import json
+import threading
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 from bean_lens import BeanInfo, Origin, normalize_bean_info
 from bean_lens.normalization import NormalizationConfig, NormalizationEngine
@@ -238,6 +242,7 @@ def test_unmapped_sends_webhook(monkeypatch):
         )
     )
     engine.normalize_one("process", "Mystery Process")
+    assert engine_module.flush_unknown_webhooks(timeout=5.0)
 
     assert len(captured) == 1
     url, payload, timeout_sec, token = captured[0]
@@ -246,3 +251,328 @@ def test_unmapped_sends_webhook(monkeypatch):
     assert token == "secret-token"
     assert payload["domain"] == "process"
     assert payload["reason"] == "no_dictionary_match"
+
+
+def test_fuzzy_match_without_rapidfuzz(monkeypatch):
+    monkeypatch.setattr(engine_module, "rf_process", None)
+    engine = NormalizationEngine(
+        config=NormalizationConfig(fuzzy_threshold=0.7, flavor_note_mode="legacy")
+    )
+
+    item = engine.normalize_one("flavor_note", "chocolet")
+
+    assert item.method == "fuzzy"
+    assert item.normalized_key == "chocolate"
+
+
+def test_normalize_bean_info_reuses_engine_per_config():
+    engine_module._get_engine.cache_clear()
+
+    normalize_bean_info(BeanInfo(process="Washed"))
+    normalize_bean_info(BeanInfo(process="Natural"))
+    normalize_bean_info(BeanInfo(process="Washed"), flavor_note_mode="legacy")
+
+    info = engine_module._get_engine.cache_info()
+    assert info.misses == 2
+    assert info.hits == 1
+
+
+def test_repeated_unmapped_value_is_queued_every_time(tmp_path):
+    queue_path = tmp_path / "unknown.jsonl"
+    engine = NormalizationEngine(
+        config=NormalizationConfig(unknown_queue_path=str(queue_path))
+    )
+
+    engine.normalize_one("process", "Mystery Process")
+    engine.normalize_one("process", "Mystery Process")
+
+    lines = queue_path.read_text(encoding="utf-8").strip().splitlines()
+    assert len(lines) == 2
+
+
+def test_webhook_delivery_does_not_block_normalization(monkeypatch):
+    release = threading.Event()
+    delivered: list[dict] = []
+
+    def slow_send(url: str, payload: dict, *, timeout_sec: float, token: str | None) -> None:
+        release.wait(timeout=5.0)
+        delivered.append(payload)
+
+    monkeypatch.setattr(engine_module, "_send_unknown_webhook", slow_send)
+
+    engine = NormalizationEngine(
+        config=NormalizationConfig(unknown_queue_webhook_url="https://example.com/hook")
+    )
+    item = engine.normalize_one("process", "Mystery Process")
+
+    assert item.method == "unmapped"
+    assert delivered == []
+    release.set()
+    assert engine_module.flush_unknown_webhooks(timeout=5.0)
+    assert len(delivered) == 1
+
+
+def test_webhooks_reuse_one_connection(monkeypatch):
+    for name in ("http_proxy", "HTTP_PROXY", "all_proxy", "ALL_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    received: list[tuple[dict, str | None]] = []
+    client_ports: set[int] = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            received.append((json.loads(body), self.headers.get("x-webhook-token")))
+            client_ports.add(self.client_address[1])
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/hook"
+    try:
+        for raw in ("Mystery One", "Mystery Two"):
+            engine_module._send_unknown_webhook(
+                url, {"raw": raw}, timeout_sec=2.0, token="secret-token"
+            )
+    finally:
+        for conn in engine_module._webhook_connections.values():
+            conn.close()
+        engine_module._webhook_connections.clear()
+        server.shutdown()
+        server.server_close()
+
+    assert received == [
+        ({"raw": "Mystery One"}, "secret-token"),
+        ({"raw": "Mystery Two"}, "secret-token"),
+    ]
+    assert len(client_ports) == 1
+
+
+def test_webhooks_follow_307_and_reject_other_redirects(monkeypatch, caplog):
+    for name in ("http_proxy", "HTTP_PROXY", "all_proxy", "ALL_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+    received: list[tuple[str, dict]] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            if self.path == "/moved":
+                self.send_response(307)
+                self.send_header("Location", "/hook")
+            elif self.path == "/see-other":
+                self.send_response(302)
+                self.send_header("Location", "/hook")
+            else:
+                received.append((self.path, json.loads(body)))
+                self.send_response(204)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    try:
+        with caplog.at_level("WARNING", logger=engine_module.__name__):
+            engine_module._send_unknown_webhook(
+                f"{base}/moved", {"raw": "Mystery One"}, timeout_sec=2.0, token=None
+            )
+            engine_module._send_unknown_webhook(
+                f"{base}/see-other", {"raw": "Mystery Two"}, timeout_sec=2.0, token=None
+            )
+    finally:
+        for conn in engine_module._webhook_connections.values():
+            conn.close()
+        engine_module._webhook_connections.clear()
+        server.shutdown()
+        server.server_close()
+
+    assert received == [("/hook", {"raw": "Mystery One"})]
+    assert "answered 302; redirect not followed" in caplog.text
+
+
+def test_list_variants_of_same_unknown_value_are_queued_once(tmp_path):
+    queue_path = tmp_path / "unknown.jsonl"
+    engine = NormalizationEngine(
+        config=NormalizationConfig(unknown_queue_path=str(queue_path))
+    )
+
+    result = engine.normalize_bean_info(
+        BeanInfo(flavor_notes=["Mystery Note", "mystery note", "MYSTERY-NOTE"])
+    )
+
+    assert len(result.flavor_notes) == 1
+    assert result.flavor_notes[0].raw == "Mystery Note"
+    lines = queue_path.read_text(encoding="utf-8").strip().splitlines()
+    assert len(lines) == 1
+
+
+def test_unknown_items_of_one_bean_are_appended_in_one_write(tmp_path, monkeypatch):
+    queue_path = tmp_path / "unknown.jsonl"
+    engine = NormalizationEngine(
+        config=NormalizationConfig(unknown_queue_path=str(queue_path))
+    )
+    writes: list[bytes] = []
+    real_write = engine_module.os.write
+
+    def counting_write(fd, data):
+        writes.append(data)
+        return real_write(fd, data)
+
+    monkeypatch.setattr(engine_module.os, "write", counting_write)
+
+    engine.normalize_bean_info(
+        BeanInfo(process="Mystery Process", flavor_notes=["Mystery Note", "Other Mystery"])
+    )
+
+    assert len(writes) == 1
+    lines = queue_path.read_text(encoding="utf-8").strip().splitlines()
+    assert [json.loads(line)["raw"] for line in lines] == [
+        "Mystery Process",
+        "Mystery Note",
+        "Other Mystery",
+    ]
+
+
+def test_normalize_many_returns_item_per_input_and_writes_once(tmp_path, monkeypatch):
+    queue_path = tmp_path / "unknown.jsonl"
+    engine = NormalizationEngine(
+        config=NormalizationConfig(unknown_queue_path=str(queue_path))
+    )
+    writes: list[bytes] = []
+    real_write = engine_module.os.write
+
+    def counting_write(fd, data):
+        writes.append(data)
+        return real_write(fd, data)
+
+    monkeypatch.setattr(engine_module.os, "write", counting_write)
+
+    items = engine.normalize_many(
+        "process", ["Washed", "Mystery Process", "Washed", "Mystery Process"]
+    )
+
+    assert [item.normalized_key for item in items] == ["washed", None, "washed", None]
+    assert len(writes) == 1
+    lines = queue_path.read_text(encoding="utf-8").strip().splitlines()
+    assert len(lines) == 2
+
+
+def test_unknown_queue_reopens_rotated_file(tmp_path):
+    queue_path = tmp_path / "unknown.jsonl"
+    rotated_path = tmp_path / "unknown.jsonl.1"
+    engine = NormalizationEngine(
+        config=NormalizationConfig(unknown_queue_path=str(queue_path))
+    )
+
+    engine.normalize_one("process", "Mystery Process")
+    queue_path.rename(rotated_path)
+    engine.normalize_one("process", "Other Mystery")
+    queue_path.unlink()
+    engine.normalize_one("process", "Third Mystery")
+
+    assert json.loads(rotated_path.read_text(encoding="utf-8"))["raw"] == "Mystery Process"
+    assert json.loads(queue_path.read_text(encoding="utf-8"))["raw"] == "Third Mystery"
+
+
+def test_unknown_queue_retries_short_writes(tmp_path, monkeypatch):
+    queue_path = tmp_path / "unknown.jsonl"
+    real_write = engine_module.os.write
+
+    def short_write(fd: int, data) -> int:
+        return real_write(fd, bytes(data[:7]))
+
+    monkeypatch.setattr(engine_module.os, "write", short_write)
+    engine = NormalizationEngine(
+        config=NormalizationConfig(unknown_queue_path=str(queue_path))
+    )
+
+    engine.normalize_many("process", ["Mystery Process", "Other Mystery"])
+
+    lines = queue_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["raw"] for line in lines] == ["Mystery Process", "Other Mystery"]
+
+
+def test_dropped_engine_closes_unknown_queue_without_cycle_collection(tmp_path):
+    engine = NormalizationEngine(
+        config=NormalizationConfig(unknown_queue_path=str(tmp_path / "unknown.jsonl"))
+    )
+    engine.normalize_one("process", "Mystery Process")
+    closer = engine._unknown_queue_closer
+    engine_ref = weakref.ref(engine)
+
+    gc.disable()
+    try:
+        del engine
+        assert engine_ref() is None
+        assert not closer.alive
+    finally:
+        gc.enable()
+
+
+def test_webhook_worker_logs_unexpected_errors(monkeypatch, caplog):
+    def broken_send(url: str, payload: dict, *, timeout_sec: float, token: str | None) -> None:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(engine_module, "_send_unknown_webhook", broken_send)
+    engine = NormalizationEngine(
+        config=NormalizationConfig(unknown_queue_webhook_url="https://example.com/hook")
+    )
+
+    with caplog.at_level("ERROR", logger=engine_module.__name__):
+        engine.normalize_one("process", "Mystery Process")
+        assert engine_module.flush_unknown_webhooks(timeout=5.0)
+
+    assert "unexpected error delivering unknown-queue webhook" in caplog.text
+
+
+def test_full_webhook_backlog_logs_dropped_record(monkeypatch, caplog):
+    engine_module._ensure_webhook_worker()
+    full_queue = engine_module.queue.Queue(maxsize=1)
+    full_queue.put_nowait(("https://example.com/hook", {}, 1.0, None, None))
+    monkeypatch.setattr(engine_module, "_webhook_queue", full_queue)
+    engine = NormalizationEngine(
+        config=NormalizationConfig(unknown_queue_webhook_url="https://example.com/hook")
+    )
+
+    with caplog.at_level("WARNING", logger=engine_module.__name__):
+        engine.normalize_one("process", "Mystery Process")
+
+    assert "dropped process record 'Mystery Process'" in caplog.text
+
+
+def test_tracked_webhooks_wait_only_for_their_own_records(monkeypatch):
+    release = threading.Event()
+    sent: list[str] = []
+
+    def send(url: str, payload: dict, *, timeout_sec: float, token: str | None) -> None:
+        if payload["raw"] == "Other Process":
+            release.wait(5.0)
+        sent.append(payload["raw"])
+
+    monkeypatch.setattr(engine_module, "_send_unknown_webhook", send)
+    engine = NormalizationEngine(
+        config=NormalizationConfig(unknown_queue_webhook_url="https://example.com/hook")
+    )
+
+    try:
+        with engine_module.track_unknown_webhooks() as webhooks:
+            engine.normalize_one("process", "Mystery Process")
+        engine.normalize_one("process", "Other Process")
+
+        assert len(webhooks) == 1
+        assert webhooks.wait(timeout_per_item=5.0)
+        assert sent == ["Mystery Process"]
+        assert not engine_module.flush_unknown_webhooks(timeout=0.05)
+    finally:
+        release.set()
+        assert engine_module.flush_unknown_webhooks(timeout=5.0)
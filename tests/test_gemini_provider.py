@@ -0,0 +1,115 @@
+"""Tests for the Gemini provider."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from google.genai import errors, types
+from PIL import Image
+
+from bean_lens.cache import SHARED_MEMORY_CACHE, ExtractionCache
+from bean_lens.exceptions import AuthenticationError, RateLimitError
+from bean_lens.providers.gemini import GeminiProvider
+
+
+class MockModels:
+    def __init__(self, error=None):
+        self.calls = []
+        self.error = error
+
+    def generate_content(self, *, model, contents, config):
+        self.calls.append(contents)
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(text='{"roastery": "Gemini Roastery"}')
+
+
+class MockAsyncModels(MockModels):
+    async def generate_content(self, **kwargs):
+        return MockModels.generate_content(self, **kwargs)
+
+
+def make_provider(cache=None, error=None):
+    provider = GeminiProvider(api_key="test-key", cache=cache)
+    provider.cache = cache
+    provider.client = SimpleNamespace(
+        models=MockModels(error), aio=SimpleNamespace(models=MockAsyncModels(error))
+    )
+    return provider
+
+
+def test_aextract_uses_async_client_and_sends_raw_file_bytes(tmp_path):
+    path = tmp_path / "bean.png"
+    Image.new("RGB", (20, 20), color="white").save(path, format="PNG")
+    provider = make_provider()
+
+    info = asyncio.run(provider.aextract(str(path)))
+
+    assert info.roastery == "Gemini Roastery"
+    assert provider.client.models.calls == []
+    (contents,) = provider.client.aio.models.calls
+    part = contents[0]
+    assert isinstance(part, types.Part)
+    assert part.inline_data.mime_type == "image/png"
+    assert part.inline_data.data == path.read_bytes()
+
+
+def test_extract_sends_pil_image_for_unsupported_file_types(tmp_path):
+    path = tmp_path / "bean.gif"
+    Image.new("RGB", (20, 20), color="white").save(path, format="GIF")
+    provider = make_provider()
+
+    provider.extract(path)
+
+    (contents,) = provider.client.models.calls
+    assert isinstance(contents[0], Image.Image)
+
+
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [(401, AuthenticationError), (403, AuthenticationError), (429, RateLimitError)],
+)
+def test_extract_maps_client_error_status_codes(code, expected):
+    # The message carries none of the sniffed keywords, so only the status code can map it.
+    error = errors.ClientError(code, {"error": {"message": "Denied", "status": "DENIED"}})
+    provider = make_provider(error=error)
+
+    with pytest.raises(expected):
+        provider.extract(Image.new("RGB", (20, 20), color="white"))
+
+
+def test_extract_reuses_disk_cached_result(tmp_path):
+    path = tmp_path / "bean.jpg"
+    Image.new("RGB", (20, 20), color="white").save(path, format="JPEG")
+    cache = ExtractionCache(tmp_path / "cache")
+
+    first = make_provider(cache=cache).extract(path)
+    SHARED_MEMORY_CACHE.clear()
+    provider = make_provider(cache=cache)
+    second = provider.extract(path)
+
+    assert second == first
+    assert provider.client.models.calls == []
+    assert cache.hits == 1
+
+
+def test_extract_treats_invalid_cache_entry_as_miss(tmp_path):
+    path = tmp_path / "bean.jpg"
+    Image.new("RGB", (20, 20), color="white").save(path, format="JPEG")
+    cache = ExtractionCache(tmp_path / "cache")
+    provider = make_provider(cache=cache)
+    _, key = provider._prepare(path)
+    cache.set(key, {"variety": "not a list"})
+
+    info = provider.extract(path)
+
+    assert info.roastery == "Gemini Roastery"
+    assert len(provider.client.models.calls) == 1
+
+
+def test_prepare_skips_pixel_hash_without_disk_cache():
+    provider = make_provider()
+
+    _, key = provider._prepare(Image.new("RGB", (20, 20), color="white"))
+
+    assert key is None
@@ -1,9 +1,17 @@
 """Tests for Google Vision OCR provider parsing."""
 
+import asyncio
+import re
+import threading
+from io import BytesIO
 from types import SimpleNamespace
 
+import pytest
+from google.api_core import exceptions as gax
 from PIL import Image
 
+from bean_lens.cache import SHARED_MEMORY_CACHE, ExtractionCache
+from bean_lens.exceptions import AuthenticationError, ImageError, RateLimitError
 from bean_lens.providers.google_vision_ocr import GoogleVisionOCRProvider
 
 
@@ -104,3 +112,391 @@ def test_extract_falls_back_when_text_llm_fails():
     assert info.origin is not None
     assert info.origin.country == "Ethiopia"
     assert metadata["parser"] == "heuristic_fallback"
+
+
+def test_extract_batch_chunks_requests_and_keeps_order():
+    class MockOCRClient:
+        def __init__(self):
+            self.batch_sizes = []
+            self.calls = 0
+
+        def batch_annotate_images(self, requests):
+            self.batch_sizes.append(len(requests))
+            responses = []
+            for _ in requests:
+                self.calls += 1
+                responses.append(
+                    SimpleNamespace(
+                        text_annotations=[SimpleNamespace(description=f"Roastery: Roastery {self.calls}")],
+                        error=SimpleNamespace(message=""),
+                    )
+                )
+            return SimpleNamespace(responses=responses)
+
+    client = MockOCRClient()
+    provider = GoogleVisionOCRProvider(client=client, llm_enabled=False)
+    images = [Image.new("RGB", (20, 20), color="white") for _ in range(18)]
+    infos = provider.extract_batch(images)
+
+    assert client.batch_sizes == [16, 2]
+    assert [info.roastery for info in infos] == [f"Roastery {i}" for i in range(1, 19)]
+    assert provider.get_extraction_metadata()["parser"] == "ocr_heuristic"
+
+
+def test_aextract_many_returns_results_in_input_order():
+    class MockOCRClient:
+        def text_detection(self, image):
+            color = Image.open(BytesIO(image["content"])).getpixel((0, 0))
+            return SimpleNamespace(
+                text_annotations=[SimpleNamespace(description=f"Roastery: Roastery {color[0]}")],
+                error=SimpleNamespace(message=""),
+            )
+
+    provider = GoogleVisionOCRProvider(client=MockOCRClient(), llm_enabled=False)
+    images = [Image.new("RGB", (20, 20), color=(shade, 0, 0)) for shade in range(6)]
+    infos = asyncio.run(provider.aextract_many(images, concurrency=3, stagger=0.01))
+
+    assert [info.roastery for info in infos] == [f"Roastery {shade}" for shade in range(6)]
+
+
+def test_extract_reuses_cached_result_for_same_image(tmp_path):
+    class MockOCRClient:
+        def __init__(self):
+            self.calls = 0
+
+        def text_detection(self, image):
+            self.calls += 1
+            return SimpleNamespace(
+                text_annotations=[SimpleNamespace(description="Roastery: Cached Roastery\nOrigin: Kenya")],
+                error=SimpleNamespace(message=""),
+            )
+
+    client = MockOCRClient()
+    cache = ExtractionCache(tmp_path)
+    image = Image.new("RGB", (20, 20), color="white")
+
+    first = GoogleVisionOCRProvider(client=client, llm_enabled=False, cache=cache).extract(image)
+    SHARED_MEMORY_CACHE.clear()
+    provider = GoogleVisionOCRProvider(client=client, llm_enabled=False, cache=cache)
+    second = provider.extract(image)
+
+    assert client.calls == 1
+    assert second == first
+    assert cache.hits == 1
+    assert provider.get_extraction_metadata()["ocr_text"] == "Roastery: Cached Roastery\nOrigin: Kenya"
+
+
+def test_extract_sends_supported_image_files_without_reencoding(tmp_path):
+    class MockOCRClient:
+        def __init__(self):
+            self.contents = []
+
+        def text_detection(self, image):
+            self.contents.append(image["content"])
+            return SimpleNamespace(text_annotations=[], error=SimpleNamespace(message=""))
+
+    path = tmp_path / "bean.jpg"
+    Image.new("RGB", (20, 20), color="white").save(path, format="JPEG")
+    client = MockOCRClient()
+
+    GoogleVisionOCRProvider(client=client, llm_enabled=False).extract(str(path))
+
+    assert client.contents == [path.read_bytes()]
+
+
+def test_extract_reuses_source_bytes_of_unmodified_pil_image():
+    class MockOCRClient:
+        def __init__(self):
+            self.contents = []
+
+        def text_detection(self, image):
+            self.contents.append(image["content"])
+            return SimpleNamespace(text_annotations=[], error=SimpleNamespace(message=""))
+
+    buffer = BytesIO()
+    Image.new("RGB", (20, 20), color="white").save(buffer, format="JPEG", quality=42)
+    client = MockOCRClient()
+
+    GoogleVisionOCRProvider(client=client, llm_enabled=False).extract(Image.open(BytesIO(buffer.getvalue())))
+
+    assert client.contents == [buffer.getvalue()]
+
+
+def test_extract_downscales_large_images_to_jpeg(tmp_path):
+    class MockOCRClient:
+        def __init__(self):
+            self.contents = []
+
+        def text_detection(self, image):
+            self.contents.append(image["content"])
+            return SimpleNamespace(text_annotations=[], error=SimpleNamespace(message=""))
+
+    path = tmp_path / "large.png"
+    Image.new("RGBA", (3200, 800), color="white").save(path, format="PNG")
+    client = MockOCRClient()
+
+    GoogleVisionOCRProvider(client=client, llm_enabled=False).extract(path)
+    sent = Image.open(BytesIO(client.contents[0]))
+
+    assert sent.format == "JPEG"
+    assert sent.size == (1600, 400)
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (gax.ResourceExhausted("busy"), RateLimitError),
+        (gax.PermissionDenied("denied"), AuthenticationError),
+    ],
+)
+def test_extract_classifies_typed_api_errors(error, expected):
+    class FailingOCRClient:
+        def text_detection(self, image):
+            raise error
+
+    provider = GoogleVisionOCRProvider(client=FailingOCRClient(), llm_enabled=False)
+
+    with pytest.raises(expected):
+        provider.extract(Image.new("RGB", (20, 20), color="white"))
+
+
+def test_extract_skips_text_llm_for_near_empty_ocr_text():
+    class MockOCRClient:
+        def text_detection(self, image):
+            return SimpleNamespace(
+                text_annotations=[SimpleNamespace(description="A 12")],
+                error=SimpleNamespace(message=""),
+            )
+
+    class UnexpectedLLMClient:
+        class Models:
+            @staticmethod
+            def generate_content(model, contents, config):
+                raise AssertionError("llm should not be called")
+
+        models = Models()
+
+    provider = GoogleVisionOCRProvider(client=MockOCRClient(), llm_client=UnexpectedLLMClient())
+    info = provider.extract(image=Image.new("RGB", (20, 20), color="white"))
+
+    assert info.roastery == "A 12"
+    assert provider.get_extraction_metadata()["parser"] == "ocr_heuristic"
+
+
+def test_extract_reuses_llm_parse_for_identical_ocr_text(tmp_path):
+    class MockOCRClient:
+        def text_detection(self, image):
+            return SimpleNamespace(
+                text_annotations=[SimpleNamespace(description="Roastery: Same text on every image")],
+                error=SimpleNamespace(message=""),
+            )
+
+    class CountingLLMClient:
+        calls = 0
+
+        class Models:
+            @staticmethod
+            def generate_content(model, contents, config):
+                CountingLLMClient.calls += 1
+                return SimpleNamespace(text='{"roastery":"LLM Roastery","flavor_notes":["Cocoa"]}')
+
+        models = Models()
+
+    provider = GoogleVisionOCRProvider(
+        client=MockOCRClient(), llm_client=CountingLLMClient(), cache=ExtractionCache(tmp_path)
+    )
+    first = provider.extract(image=Image.new("RGB", (20, 20), color="white"))
+    first.flavor_notes.append("Mutated")
+    second = provider.extract(image=Image.new("RGB", (20, 20), color="black"))
+
+    assert second.roastery == "LLM Roastery"
+    assert second.flavor_notes == ["Cocoa"]
+    assert CountingLLMClient.calls == 1
+    assert provider.get_extraction_metadata()["parser"] == "ocr_text_llm"
+
+
+def test_extract_calls_text_llm_every_time_when_caching_is_disabled():
+    class MockOCRClient:
+        def text_detection(self, image):
+            return SimpleNamespace(
+                text_annotations=[SimpleNamespace(description="Roastery: Same text on every image")],
+                error=SimpleNamespace(message=""),
+            )
+
+    class CountingLLMClient:
+        calls = 0
+
+        class Models:
+            @staticmethod
+            def generate_content(model, contents, config):
+                CountingLLMClient.calls += 1
+                return SimpleNamespace(text='{"roastery":"LLM Roastery"}')
+
+        models = Models()
+
+    provider = GoogleVisionOCRProvider(client=MockOCRClient(), llm_client=CountingLLMClient())
+    provider.cache = None
+    provider.extract(image=Image.new("RGB", (20, 20), color="white"))
+    provider.extract(image=Image.new("RGB", (20, 20), color="black"))
+
+    assert CountingLLMClient.calls == 2
+
+
+@pytest.mark.parametrize("filename", ["missing.jpg", "missing.gif"])
+def test_extract_reports_missing_image_file(tmp_path, filename):
+    provider = GoogleVisionOCRProvider(client=SimpleNamespace(), llm_enabled=False)
+
+    with pytest.raises(ImageError, match="not found"):
+        provider.extract(tmp_path / filename)
+
+
+def test_extract_gcs_async_and_collect_results():
+    class MockOperation:
+        def result(self, timeout=None):
+            return SimpleNamespace(
+                output_config=SimpleNamespace(gcs_destination=SimpleNamespace(uri="gs://bucket/out/"))
+            )
+
+    class MockOCRClient:
+        def __init__(self):
+            self.requests = None
+
+        def async_batch_annotate_images(self, requests, output_config):
+            self.requests = requests
+            return MockOperation()
+
+    output = (
+        '{"responses": ['
+        '{"context": {"uri": "gs://bucket/a.jpg"}, "textAnnotations": [{"description": "Roastery: A Roasters"}]},'
+        '{"context": {"uri": "gs://bucket/b.jpg"}, "error": {"code": 3, "message": "bad image"}}'
+        "]}"
+    ).encode()
+
+    class MockStorageClient:
+        def list_blobs(self, bucket_name, prefix):
+            assert (bucket_name, prefix) == ("bucket", "out/")
+            return [SimpleNamespace(name="out/output-1-to-2.json", download_as_bytes=lambda: output)]
+
+    client = MockOCRClient()
+    provider = GoogleVisionOCRProvider(client=client, llm_enabled=False)
+    prefix = provider.extract_gcs_async(["gs://bucket/a.jpg", "gs://bucket/b.jpg"], "gs://bucket/out/")
+    results = provider.collect_gcs_results(prefix, storage_client=MockStorageClient())
+
+    assert [request["image"]["source"]["image_uri"] for request in client.requests] == [
+        "gs://bucket/a.jpg",
+        "gs://bucket/b.jpg",
+    ]
+    assert list(results) == ["gs://bucket/a.jpg"]
+    assert results["gs://bucket/a.jpg"].roastery == "A Roasters"
+
+
+def test_extract_serves_repeated_image_from_shared_memory_as_copies(tmp_path):
+    class MockOCRClient:
+        def __init__(self):
+            self.calls = 0
+
+        def text_detection(self, image):
+            self.calls += 1
+            return SimpleNamespace(
+                text_annotations=[
+                    SimpleNamespace(description="Roastery: Memory Roastery\nVariety: Geisha")
+                ],
+                error=SimpleNamespace(message=""),
+            )
+
+    client = MockOCRClient()
+    cache = ExtractionCache(tmp_path)
+    image = Image.new("RGB", (20, 20), color="white")
+
+    # The core entry points build a fresh provider per call; the memory tier is shared.
+    first = GoogleVisionOCRProvider(client=client, llm_enabled=False, cache=cache).extract(image)
+    first.variety.append("Mutated")
+    provider = GoogleVisionOCRProvider(client=client, llm_enabled=False, cache=cache)
+    second = provider.extract(image)
+
+    assert client.calls == 1
+    assert cache.hits == 0
+    assert second is not first
+    assert second.variety == ["Geisha"]
+    assert provider.get_extraction_metadata()["ocr_text"] == "Roastery: Memory Roastery\nVariety: Geisha"
+
+
+def test_extract_does_not_memoize_results_when_caching_is_disabled():
+    class MockOCRClient:
+        def __init__(self):
+            self.calls = 0
+
+        def text_detection(self, image):
+            self.calls += 1
+            return SimpleNamespace(
+                text_annotations=[SimpleNamespace(description="Roastery: Fresh Roastery")],
+                error=SimpleNamespace(message=""),
+            )
+
+    client = MockOCRClient()
+    provider = GoogleVisionOCRProvider(client=client, llm_enabled=False)
+    provider.cache = None
+    image = Image.new("RGB", (20, 20), color="white")
+
+    first = provider.extract(image)
+    second = provider.extract(image)
+
+    assert client.calls == 2
+    assert second == first
+
+
+def test_aextract_many_propagates_provider_errors():
+    class RateLimitedOCRClient:
+        def text_detection(self, image):
+            raise gax.ResourceExhausted("busy")
+
+    provider = GoogleVisionOCRProvider(client=RateLimitedOCRClient(), llm_enabled=False)
+    images = [Image.new("RGB", (20, 20), color=(shade, 0, 0)) for shade in range(4)]
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(provider.aextract_many(images, concurrency=2, stagger=0, cpu_workers=2))
+
+
+def test_concurrent_extractions_cache_their_own_ocr_text(tmp_path):
+    class MockOCRClient:
+        def text_detection(self, image):
+            color = Image.open(BytesIO(image["content"])).getpixel((0, 0))
+            return SimpleNamespace(
+                text_annotations=[SimpleNamespace(description=f"Roastery: Roastery {color[0]}")],
+                error=SimpleNamespace(message=""),
+            )
+
+    class SlowLLMClient:
+        class Models:
+            # Every call waits for the others, so all four structure their text concurrently.
+            barrier = threading.Barrier(4, timeout=5)
+
+            def generate_content(self, model, contents, config):
+                shade = re.search(r"Roastery (\d+)", contents[0]).group(1)
+                self.barrier.wait()
+                if shade == "3":
+                    raise RuntimeError("llm unavailable")
+                return SimpleNamespace(text=f'{{"roastery":"LLM Roastery {shade}"}}')
+
+        models = Models()
+
+    cache = ExtractionCache(tmp_path)
+    provider = GoogleVisionOCRProvider(
+        client=MockOCRClient(), llm_client=SlowLLMClient(), cache=cache
+    )
+    images = [Image.new("RGB", (20, 20), color=(shade, 0, 0)) for shade in range(4)]
+    infos = asyncio.run(provider.aextract_many(images, concurrency=4, stagger=0, cpu_workers=4))
+
+    assert [info.roastery for info in infos] == [
+        "LLM Roastery 0",
+        "LLM Roastery 1",
+        "LLM Roastery 2",
+        "Roastery 3",
+    ]
+    for shade, image in enumerate(images):
+        stored = cache.get(provider._cache_key(provider._prepare(image)))
+        if shade == 3:
+            assert stored is None
+        else:
+            assert stored["ocr_text"] == f"Roastery: Roastery {shade}"
+            assert stored["parser"] == "ocr_text_llm"
@@ -1,5 +1,8 @@
 """Tests for schema models."""
 
+import pytest
+from pydantic import ValidationError
+
 from bean_lens import BeanInfo, Origin
 
 
@@ -75,3 +78,10 @@ def test_bean_info_json_deserialization():
     info = BeanInfo.model_validate_json(json_str)
     assert info.roastery == "Test"
     assert info.origin.country == "Brazil"
+
+
+def test_bean_info_is_immutable():
+    """BeanInfo should reject attribute assignment."""
+    info = BeanInfo(roastery="Test")
+    with pytest.raises(ValidationError):
+        info.roastery = "Other"